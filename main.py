@@ -1,3 +1,4 @@
+import math
 import sys
 import numpy as np
 from PyQt5.QtWidgets import QComboBox
@@ -5,10 +6,26 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                            QHBoxLayout, QLabel, QSpinBox, QDoubleSpinBox,
                            QPushButton, QListWidget, QGroupBox, QCheckBox,
                            QGridLayout, QFrame, QSlider)
-from PyQt5.QtCore import Qt, QLocale
+from PyQt5.QtCore import Qt, QLocale, QTimer, QRectF
+import matplotlib
+matplotlib.use('Qt5Agg')
+# Cheaper Agg rendering: aggressive path simplification and chunked
+# path flushing keep canvas draws short during interactive drags
+matplotlib.rcParams['path.simplify'] = True
+matplotlib.rcParams['path.simplify_threshold'] = 1.0
+matplotlib.rcParams['agg.path.chunksize'] = 10000
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+try:
+    import pyqtgraph as pg
+    pg.setConfigOptions(imageAxisOrder='row-major')
+except ImportError:
+    pg = None
 from phased_array import PhasedArrayUnit, MultiArraySystem
 from scipy import constants
 from scenario_manager import ScenarioManager
@@ -30,6 +47,33 @@ class BeamformingSimulator(QMainWindow):
         
         # Initialize the multi-array system
         self.system = MultiArraySystem()
+
+        # Shared angle grid for the radiation pattern, reused on every refresh
+        self._theta = np.linspace(0, 2 * np.pi, 361)
+
+        # Debounce timer coalescing slider-driven refreshes: restarting the
+        # countdown on every tick means only the final drag position renders
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(40)
+        self._update_timer.timeout.connect(self._do_update_plots)
+
+        # Persistent plot artists, created on the first refresh and updated
+        # in place afterwards instead of rebuilding the figures
+        self._pattern_ax = None
+        self._pattern_line = None
+        self._steering_line = None
+        self._interference_ax = None
+        self._interference_im = None
+        self._interference_cbar = None
+        self._array_ax = None
+        self._geom_scatters = []
+        self._empty_text = None
+
+        # Interference grid resolution: a coarse preview grid while a slider
+        # is being dragged, full resolution once it is released
+        self._grid_n_drag = 150
+        self._grid_n_final = 400
         
         # Set style
         self.setStyle()
@@ -105,8 +149,9 @@ class BeamformingSimulator(QMainWindow):
         self.scenario_manager.load_scenario(scenario_name)
 
     def setStyle(self):
-        # Set scientific style for matplotlib
-        plt.style.use('bmh')  # Using a built-in style that's more scientific
+        # Set scientific style for matplotlib; layering 'fast' on top keeps
+        # the bmh look while restoring the cheap-rendering rc settings
+        plt.style.use(['bmh', 'fast'])
 
     def create_control_panel(self):
         panel = QWidget()
@@ -273,6 +318,12 @@ class BeamformingSimulator(QMainWindow):
         self.curved_check.stateChanged.connect(self.on_parameter_changed)
         self.radius_spin.valueChanged.connect(self.on_parameter_changed)
 
+        # Re-render at full grid resolution once a drag ends
+        for slider in (self.steering_slider, self.num_elements_slider,
+                       self.spacing_slider, self.freq_slider,
+                       self.pos_x_slider, self.pos_y_slider):
+            slider.sliderReleased.connect(self.update_plots)
+
         return panel
 
     # Add these new methods
@@ -286,18 +337,36 @@ class BeamformingSimulator(QMainWindow):
 
     def update_array_parameters(self, array):
         """Update the parameters of the selected array"""
-        array.num_elements = self.num_elements_slider.value()
-        array.element_spacing = self.spacing_slider.value() / 100.0
-        array.frequency = self.freq_slider.value() / 10.0 * 1e9
-        array.position = np.array([self.pos_x_slider.value() / 10.0, 
-                                 self.pos_y_slider.value() / 10.0])
-        array.is_curved = self.curved_check.isChecked()
-        array.curvature_radius = (self.radius_spin.value() 
-                                if self.curved_check.isChecked() else None)
-        array.wavelength = constants.c / array.frequency
-        array.wave_number = 2 * np.pi / array.wavelength
-        array.update_element_positions()
-        array.set_beam_direction(np.deg2rad(self.steering_angle_spin.value()))
+        num_elements = self.num_elements_slider.value()
+        element_spacing = self.spacing_slider.value() / 100.0
+        frequency = self.freq_slider.value() / 10.0 * 1e9
+        position = np.array([self.pos_x_slider.value() / 10.0,
+                             self.pos_y_slider.value() / 10.0])
+        is_curved = self.curved_check.isChecked()
+        curvature_radius = self.radius_spin.value() if is_curved else None
+
+        # Only rebuild geometry-derived state when a geometry parameter
+        # actually changed; pure steering updates skip the recompute entirely
+        frequency_changed = frequency != array.frequency
+        geometry_changed = (frequency_changed or
+                            num_elements != array.num_elements or
+                            element_spacing != array.element_spacing or
+                            not np.array_equal(position, array.position) or
+                            is_curved != array.is_curved or
+                            curvature_radius != array.curvature_radius)
+
+        array.num_elements = num_elements
+        array.element_spacing = element_spacing
+        array.frequency = frequency
+        array.position = position
+        array.is_curved = is_curved
+        array.curvature_radius = curvature_radius
+        if frequency_changed:
+            array.wavelength = constants.c / frequency
+            array.wave_number = 2 * np.pi / array.wavelength
+        if geometry_changed:
+            array.update_element_positions()
+        array.set_beam_direction(math.radians(self.steering_angle_spin.value()))
 
     def array_list_selection_changed(self):
         """Update control values when different array is selected"""
@@ -360,12 +429,24 @@ class BeamformingSimulator(QMainWindow):
         pattern_layout.addWidget(self.pattern_canvas)
         top_row.addWidget(pattern_container)
 
-        # Right side: Interference map
+        # Right side: Interference map. pyqtgraph paints images with raw
+        # QPainter and is far faster than matplotlib for per-tick image
+        # updates, so prefer it when installed
         interference_container = QWidget()
         interference_layout = QVBoxLayout(interference_container)
-        self.interference_fig = Figure(figsize=(6, 6))
-        self.interference_canvas = FigureCanvas(self.interference_fig)
-        interference_layout.addWidget(self.interference_canvas)
+        if pg is not None:
+            self.interference_widget = pg.GraphicsLayoutWidget()
+            view = self.interference_widget.addViewBox()
+            view.setAspectLocked(True)
+            self._interference_img = pg.ImageItem()
+            self._interference_img.setLookupTable(
+                pg.colormap.get('viridis').getLookupTable(0.0, 1.0, 256))
+            view.addItem(self._interference_img)
+            interference_layout.addWidget(self.interference_widget)
+        else:
+            self.interference_fig = Figure(figsize=(6, 6))
+            self.interference_canvas = FigureCanvas(self.interference_fig)
+            interference_layout.addWidget(self.interference_canvas)
         top_row.addWidget(interference_container)
 
         main_layout.addLayout(top_row)
@@ -428,7 +509,7 @@ class BeamformingSimulator(QMainWindow):
     def update_beam_steering(self):
         angle_deg = self.steering_angle_spin.value()
         # Convert to radians
-        angle_rad = np.deg2rad(angle_deg)
+        angle_rad = math.radians(angle_deg)
 
         for array in self.system.arrays:
             array.set_beam_direction(angle_rad)
@@ -458,87 +539,172 @@ class BeamformingSimulator(QMainWindow):
             return "Northwest"
 
     def update_plots(self):
-        # Clear figures
-        self.pattern_fig.clear()
-        self.interference_fig.clear()
-        self.array_fig.clear()
+        """Schedule a plot refresh, coalescing bursts of parameter changes"""
+        self._update_timer.start()
+
+    def _slider_being_dragged(self):
+        """Check whether any control slider is in an active drag"""
+        return any(slider.isSliderDown() for slider in (
+            self.steering_slider, self.num_elements_slider, self.spacing_slider,
+            self.freq_slider, self.pos_x_slider, self.pos_y_slider))
+
+    def _draw_empty_state(self):
+        """Blank the plots cheaply instead of computing a field of zeros"""
+        if self._empty_text is None:
+            self._empty_text = self.pattern_fig.text(0.5, 0.5, 'No arrays deployed',
+                                                     ha='center', va='center', fontsize=12)
+        if self._pattern_ax is not None:
+            self._pattern_line.set_data(self._theta, np.zeros_like(self._theta))
+            self._steering_line.set_data([0, 0], [0, 0])
+            self._pattern_ax.set_ylim(0, 1)
+        if pg is not None:
+            self._interference_img.clear()
+        elif self._interference_im is not None:
+            self._interference_im.set_data(np.zeros((2, 2), dtype=np.float32))
+        for scatter in self._geom_scatters:
+            scatter.remove()
+        self._geom_scatters = []
+        if self._array_ax is not None and self._array_ax.legend_ is not None:
+            self._array_ax.legend_.remove()
+
+        self.pattern_canvas.draw_idle()
+        if pg is None and self._interference_im is not None:
+            self.interference_canvas.draw_idle()
+        self.array_canvas.draw_idle()
+
+    def _do_update_plots(self):
+        # With no arrays deployed there is nothing to compute; skip the
+        # interference grid entirely
+        if not self.system.arrays:
+            self._draw_empty_state()
+            return
+        if self._empty_text is not None:
+            self._empty_text.remove()
+            self._empty_text = None
 
         # Plot radiation pattern
-        ax_pattern = self.pattern_fig.add_subplot(111, projection='polar')
-        theta = np.linspace(0, 2 * np.pi, 361)
+        theta = self._theta
         pattern = self.system.calculate_total_pattern(theta)
+        angle_rad = math.radians(self.steering_angle_spin.value())
+        max_radius = max(np.max(pattern), 1e-6)
+
+        if self._pattern_ax is None:
+            # Build the polar axes and its two line artists once; later
+            # refreshes only push new data into them
+            ax_pattern = self.pattern_fig.add_subplot(111, projection='polar')
+            ax_pattern.set_title("Radiation Pattern", pad=20, fontsize=12)
+            ax_pattern.grid(True, linestyle='--', alpha=0.7)
+            ax_pattern.minorticks_off()
+
+            # Set 0 at positive x-axis (East), counterclockwise
+            ax_pattern.set_theta_zero_location('W')  # 0 degrees at East
+            ax_pattern.set_theta_direction(-1)  # Counterclockwise
+            # Remove direction labels
+            ax_pattern.set_thetagrids([0, 45, 90, 135, 180, 225, 270, 315],
+                                      ['0', '45', '90', '135', '180', '225', '270', '315'])
+
+            self._pattern_line, = ax_pattern.plot(theta, pattern, 'b-', linewidth=2)
+            self._steering_line, = ax_pattern.plot([angle_rad, angle_rad], [0, max_radius],
+                                                   'r--', linewidth=2, label='Steering Direction')
+            self._pattern_ax = ax_pattern
+        else:
+            self._pattern_line.set_data(theta, pattern)
+            self._steering_line.set_data([angle_rad, angle_rad], [0, max_radius])
+        self._pattern_ax.set_ylim(0, max_radius)
 
-        ax_pattern.set_title("Radiation Pattern", pad=20, fontsize=12)
-        ax_pattern.grid(True, linestyle='--', alpha=0.7)
-
-        # Set 0 at positive x-axis (East), counterclockwise
-        ax_pattern.set_theta_zero_location('W')  # 0 degrees at East
-        ax_pattern.set_theta_direction(-1)  # Counterclockwise
-        # Remove direction labels
-        ax_pattern.set_thetagrids([0, 45, 90, 135, 180, 225, 270, 315],
-                                  ['0', '45', '90', '135', '180', '225', '270', '315'])
-
-        # Plot pattern and beam direction
-        ax_pattern.plot(theta, pattern, 'b-', linewidth=2)
-
-        # Add beam direction indicator
-        angle_rad = np.deg2rad(self.steering_angle_spin.value())
-        max_radius = np.max(pattern)
-        ax_pattern.plot([angle_rad, angle_rad], [0, max_radius], 'r--', linewidth=2, label='Steering Direction')
-        # Plot interference map
-        ax_interference = self.interference_fig.add_subplot(111)
-
-        # Increase the range and resolution
         # Interference map calculation
         wavelength = constants.c / (self.system.arrays[0].frequency if self.system.arrays else 1e9)
-        x_range = (-10 * wavelength, 10 * wavelength, 400)
-        y_range = (-10 * wavelength, 10 * wavelength, 400)
+        grid_n = self._grid_n_drag if self._slider_being_dragged() else self._grid_n_final
+        x_range = (-10 * wavelength, 10 * wavelength, grid_n)
+        y_range = (-10 * wavelength, 10 * wavelength, grid_n)
 
         X, Y, field = self.system.calculate_total_interference_map(x_range, y_range)
 
-        # Rotate the interference map to match radiation pattern
-        intensity = np.abs(field) ** 2
-        rotated_intensity = np.rot90(intensity, k=0)  # Rotate 90 degrees
-
-        log_intensity = np.log1p(intensity)
-        if np.max(log_intensity) > 0:
-            log_intensity = log_intensity / np.max(log_intensity)
+        # Fuse abs^2 and log1p into a single pass over the grid instead of
+        # materializing the intermediate intensity array
+        if ne is not None:
+            log_intensity = ne.evaluate("log1p(real(f)*real(f) + imag(f)*imag(f))",
+                                        local_dict={'f': field})
         else:
-            log_intensity = np.zeros_like(log_intensity)
-        log_intensity = log_intensity / np.max(log_intensity)
-
-        im = ax_interference.imshow(log_intensity,
-                                    extent=[x_range[0], x_range[1], y_range[0], y_range[1]],
-                                    origin='lower',
-                                    cmap='viridis',
-                                    aspect='equal')
-
-        ax_interference.set_title("Interference Pattern\nBrighter areas: Constructive Interference", pad=20,
-                                  fontsize=12)
-        ax_interference.set_xlabel("X Position (m)", fontsize=10)
-        ax_interference.set_ylabel("Y Position (m)", fontsize=10)
-
-        # Add a colorbar with log-scaled labels
-        cbar = self.interference_fig.colorbar(im, ax=ax_interference, label="Log Normalized Intensity")
-        # Plot array geometry
-        ax_array = self.array_fig.add_subplot(111)
-        for i, array in enumerate(self.system.arrays):
-            positions = array.element_positions
-            ax_array.scatter(positions[:, 0], positions[:, 1], marker='o',
-                           label=f'Array {i+1}', s=50)
-
-        ax_array.set_title("Array Geometry", pad=20, fontsize=12)
-        ax_array.set_xlabel("X Position (m)", fontsize=10)
-        ax_array.set_ylabel("Y Position (m)", fontsize=10)
-        ax_array.grid(True, linestyle='--', alpha=0.7)
-        ax_array.set_aspect('equal')
+            log_intensity = np.log1p(np.abs(field) ** 2)
+        max_log = log_intensity.max()
+        if max_log > 0:
+            log_intensity *= 1.0 / max_log
+
+        extent = [x_range[0], x_range[1], y_range[0], y_range[1]]
+        if pg is not None:
+            self._interference_img.setImage(log_intensity, autoLevels=False,
+                                            levels=(0.0, 1.0))
+            # Map image pixels onto physical coordinates
+            self._interference_img.setRect(QRectF(x_range[0], y_range[0],
+                                                  x_range[1] - x_range[0],
+                                                  y_range[1] - y_range[0]))
+        elif self._interference_im is None:
+            ax_interference = self.interference_fig.add_subplot(111)
+            self._interference_im = ax_interference.imshow(log_intensity,
+                                                           extent=extent,
+                                                           origin='lower',
+                                                           cmap='viridis',
+                                                           aspect='equal',
+                                                           interpolation='bilinear',
+                                                           vmin=0.0, vmax=1.0)
+
+            ax_interference.set_title("Interference Pattern\nBrighter areas: Constructive Interference", pad=20,
+                                      fontsize=12)
+            ax_interference.set_xlabel("X Position (m)", fontsize=10)
+            ax_interference.set_ylabel("Y Position (m)", fontsize=10)
+
+            # Add a colorbar with log-scaled labels
+            self._interference_cbar = self.interference_fig.colorbar(
+                self._interference_im, ax=ax_interference, label="Log Normalized Intensity")
+            self._interference_ax = ax_interference
+        else:
+            self._interference_im.set_data(log_intensity)
+            # The extent tracks the wavelength of the first array
+            self._interference_im.set_extent(extent)
+            # Levels are pinned to [0, 1], so the existing colorbar only
+            # needs to be resynced with the image, never rebuilt
+            self._interference_cbar.update_normal(self._interference_im)
+
+        # Plot array geometry; scatters are rebuilt only when the number of
+        # arrays changes, otherwise their offsets are updated in place
+        if self._array_ax is None:
+            ax_array = self.array_fig.add_subplot(111)
+            ax_array.set_title("Array Geometry", pad=20, fontsize=12)
+            ax_array.set_xlabel("X Position (m)", fontsize=10)
+            ax_array.set_ylabel("Y Position (m)", fontsize=10)
+            ax_array.grid(True, linestyle='--', alpha=0.7)
+            ax_array.set_aspect('equal')
+            self._array_ax = ax_array
+
+        if len(self._geom_scatters) != len(self.system.arrays):
+            for scatter in self._geom_scatters:
+                scatter.remove()
+            self._geom_scatters = [
+                self._array_ax.scatter(array.element_positions[:, 0],
+                                       array.element_positions[:, 1],
+                                       marker='o', label=f'Array {i+1}', s=50)
+                for i, array in enumerate(self.system.arrays)
+            ]
+            if self.system.arrays:
+                self._array_ax.legend()
+        else:
+            for scatter, array in zip(self._geom_scatters, self.system.arrays):
+                scatter.set_offsets(array.element_positions)
+
         if self.system.arrays:
-            ax_array.legend()
+            all_positions = np.vstack([array.element_positions for array in self.system.arrays])
+            margin = max(np.ptp(all_positions), 1.0) * 0.1
+            self._array_ax.set_xlim(all_positions[:, 0].min() - margin,
+                                    all_positions[:, 0].max() + margin)
+            self._array_ax.set_ylim(all_positions[:, 1].min() - margin,
+                                    all_positions[:, 1].max() + margin)
 
         # Update all canvases
-        self.pattern_canvas.draw()
-        self.interference_canvas.draw()
-        self.array_canvas.draw()
+        self.pattern_canvas.draw_idle()
+        if pg is None:
+            self.interference_canvas.draw_idle()
+        self.array_canvas.draw_idle()
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)
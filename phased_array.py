@@ -1,6 +1,71 @@
+import math
+import os
+
 import numpy as np
 from scipy import constants
 
+try:
+    import numexpr as ne
+    ne.set_num_threads(os.cpu_count())
+except ImportError:
+    ne = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _array_factor(px, py, phase_shifts, k, theta, out):
+        num_elements = px.size
+        for j in prange(theta.size):
+            c = np.cos(theta[j])
+            s = np.sin(theta[j])
+            # Scalar real/imag accumulators let LLVM pair the cos/sin into
+            # one sincos call and vectorize the element loop
+            acc_re = 0.0
+            acc_im = 0.0
+            for n in range(num_elements):
+                phase = k * (px[n] * c + py[n] * s) + phase_shifts[n]
+                acc_re += math.cos(phase)
+                acc_im += math.sin(phase)
+            out[j] = math.sqrt(acc_re * acc_re + acc_im * acc_im) / num_elements
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _interference(px, py, phase_shifts, k_elem, x, y, field_out):
+        eps = 1e-9
+        for i in prange(y.size):
+            yi = y[i]
+            for j in range(x.size):
+                xj = x[j]
+                acc_re = 0.0
+                acc_im = 0.0
+                for n in range(px.size):
+                    dx = xj - px[n]
+                    dy = yi - py[n]
+                    R = np.sqrt(dx * dx + dy * dy)
+                    if R < eps:
+                        R = eps
+                    phase = k_elem[n] * R + phase_shifts[n]
+                    amp = 1.0 / np.sqrt(R)
+                    # exp(-1j*phase) = cos(phase) - 1j*sin(phase); the
+                    # explicit pair compiles to a single sincos call
+                    acc_re += math.cos(phase) * amp
+                    acc_im -= math.sin(phase) * amp
+                field_out[i, j] += complex(acc_re, acc_im)
+
+    # Warm the JIT at import so the first refresh does not pay compile cost
+    _array_factor(np.zeros(1), np.zeros(1), np.zeros(1), 1.0, np.zeros(2), np.zeros(2))
+    _interference(np.zeros(1, dtype=np.float32), np.zeros(1, dtype=np.float32),
+                  np.zeros(1, dtype=np.float32), np.ones(1, dtype=np.float32),
+                  np.zeros(2, dtype=np.float32), np.zeros(2, dtype=np.float32),
+                  np.zeros((2, 2), dtype=np.complex64))
+else:
+    _array_factor = None
+    _interference = None
+
 class PhasedArrayUnit:
     def __init__(self, position=(0, 0), num_elements=8, element_spacing=0.5, frequency=1e9, is_curved=False, curvature_radius=None):
         self.position = np.array(position)
@@ -28,7 +93,11 @@ class PhasedArrayUnit:
             x = self.curvature_radius * np.sin(theta)
             y = self.curvature_radius * (1 - np.cos(theta))
         
-        self.element_positions = np.column_stack((x, y)) + self.position
+        # Structure-of-arrays layout: the kernels stream the coordinates as
+        # two unit-stride vectors; the (N, 2) view is kept for the geometry plot
+        self._px = np.ascontiguousarray(x + self.position[0])
+        self._py = np.ascontiguousarray(y + self.position[1])
+        self.element_positions = np.column_stack((self._px, self._py))
 
     def calculate_progressive_phase_shift(self, theta_desired):
         """
@@ -53,22 +122,30 @@ class PhasedArrayUnit:
 
     def calculate_array_factor(self, theta):
         """Calculate array factor for given angles
-        
+
         Args:
             theta: Array of angles to calculate pattern for (in radians)
-            
+
         Returns:
             numpy.ndarray: Normalized array factor magnitude
         """
-        array_factor = np.zeros_like(theta, dtype=complex)
-        
-        for n in range(self.num_elements):
-            pos = self.element_positions[n]
-            # Phase due to geometry and steering
-            phase = (self.wave_number * (pos[0] * np.cos(theta) + pos[1] * np.sin(theta)) + 
-                    self.phase_shifts[n])
-            array_factor += np.exp(1j * phase)
-            
+        if _array_factor is not None:
+            # The JIT kernel fuses cos/sin/exp/sum into one parallel reduce
+            # over theta with no (N, M) temporaries
+            theta = np.ascontiguousarray(theta, dtype=np.float64)
+            out = np.empty_like(theta)
+            _array_factor(self._px, self._py,
+                          np.ascontiguousarray(self.phase_shifts, dtype=np.float64),
+                          self.wave_number, theta, out)
+            return out
+
+        # Project all element positions onto all look directions in one
+        # broadcast instead of looping over elements in Python
+        phase = (self.wave_number * (self._px[:, None] * np.cos(theta) +
+                                     self._py[:, None] * np.sin(theta)) +
+                 self.phase_shifts[:, None])
+        array_factor = np.exp(1j * phase).sum(axis=0)
+
         return np.abs(array_factor) / self.num_elements
 
     def calculate_element_phases(self, theta_desired):
@@ -85,20 +162,58 @@ class PhasedArrayUnit:
         return n * beta
 
     def calculate_interference_map(self, x_range, y_range):
-        x = np.linspace(x_range[0], x_range[1], x_range[2])
-        y = np.linspace(y_range[0], y_range[1], y_range[2])
+        x = np.linspace(x_range[0], x_range[1], x_range[2], dtype=np.float32)
+        y = np.linspace(y_range[0], y_range[1], y_range[2], dtype=np.float32)
         X, Y = np.meshgrid(x, y)
 
-        field = np.zeros_like(X, dtype=complex)
+        return X, Y, self._interference_on_grid(x, y, X, Y)
+
+    def _interference_on_grid(self, x, y, X, Y, out=None):
+        """Accumulate this array's interference field on a prebuilt grid
 
-        for n in range(self.num_elements):
-            pos = self.element_positions[n]
-            # Use consistent coordinate system calculations
-            R = np.sqrt((X - pos[0]) ** 2 + (Y - pos[1]) ** 2)
-            phase = self.wave_number * R + self.phase_shifts[n]
-            field += np.exp(-1j * phase) / np.sqrt(R)
+        The grid axes and meshgrid come from the caller so they can be
+        shared across arrays and refreshes instead of being rebuilt here.
+        When ``out`` is given, the field is added into it in place so
+        multiple arrays can share a single accumulation buffer.
+        """
+        # complex64 is plenty for a log-scaled intensity image and halves
+        # memory traffic through the dominant kernel
+        field = np.zeros_like(X, dtype=np.complex64) if out is None else out
+
+        if _interference is not None:
+            # The JIT kernel walks the grid point by point, so no
+            # (N, Ny, Nx) temporary is ever materialized
+            _interference(self._px.astype(np.float32), self._py.astype(np.float32),
+                          self.phase_shifts.astype(np.float32),
+                          np.full(self.num_elements, self.wave_number, dtype=np.float32),
+                          x, y, field)
+            return field
+
+        # Broadcast element positions against the grid along a new leading
+        # axis so the whole block is computed in one fused NumPy pass.
+        # Elements are processed in blocks of 8 to keep the (block, Ny, Nx)
+        # temporaries cache-resident for large arrays.
+        block_size = 8
+        k = np.float32(self.wave_number)
+        px = self._px.astype(np.float32)
+        py = self._py.astype(np.float32)
+        phase_shifts = self.phase_shifts.astype(np.float32)
+        for start in range(0, self.num_elements, block_size):
+            stop = min(start + block_size, self.num_elements)
+            dx = X[None, :, :] - px[start:stop, None, None]
+            dy = Y[None, :, :] - py[start:stop, None, None]
+            R = np.sqrt(dx * dx + dy * dy)
+            ps = phase_shifts[start:stop, None, None]
+            if ne is not None:
+                # numexpr evaluates the transcendental kernel in threaded,
+                # cache-sized chunks without materializing intermediates
+                block = ne.evaluate("exp(-1j * (k * R + ps)) / sqrt(R)",
+                                    local_dict={'k': k, 'R': R, 'ps': ps})
+            else:
+                block = np.exp(-1j * (k * R + ps)) / np.sqrt(R)
+            field += block.sum(axis=0)
 
-        return X, Y, field
+        return field
     
     def get_steering_info(self):
         """Get current steering parameters for display
@@ -107,7 +222,7 @@ class PhasedArrayUnit:
             dict: Dictionary containing steering parameters
         """
         return {
-            'steering_angle': np.rad2deg(self.current_steering_angle),
+            'steering_angle': math.degrees(self.current_steering_angle),
             'progressive_phase': self.calculate_progressive_phase_shift(self.current_steering_angle),
             'element_phases': self.phase_shifts,
             'element_spacing': self.element_spacing * self.wavelength,
@@ -118,38 +233,88 @@ class PhasedArrayUnit:
 class MultiArraySystem:
     def __init__(self):
         self.arrays = []
-        
+        self._grid_cache = {}
+
+    def _get_grid(self, x_range, y_range):
+        """Return (x, y, X, Y) for the requested ranges, cached across calls"""
+        key = (x_range, y_range)
+        grid = self._grid_cache.get(key)
+        if grid is None:
+            x = np.linspace(x_range[0], x_range[1], x_range[2], dtype=np.float32)
+            y = np.linspace(y_range[0], y_range[1], y_range[2], dtype=np.float32)
+            X, Y = np.meshgrid(x, y)
+            # Only the current extent is worth keeping around
+            self._grid_cache.clear()
+            grid = self._grid_cache[key] = (x, y, X, Y)
+        return grid
+
+
     def add_array(self, array):
         self.arrays.append(array)
         
     def remove_array(self, index):
         if 0 <= index < len(self.arrays):
             self.arrays.pop(index)
+
+    def clear_arrays(self):
+        """Remove all arrays in one step"""
+        self.arrays.clear()
             
+    def _stack_arrays(self):
+        """Stack per-array element data into (K, N, 2) / (K, N) batches
+
+        Only valid when every deployed array has the same element count.
+        """
+        pos_stack = np.stack([a.element_positions for a in self.arrays])
+        phase_stack = np.stack([a.phase_shifts for a in self.arrays])
+        k_per_array = np.array([a.wave_number for a in self.arrays])
+        return pos_stack, phase_stack, k_per_array
+
     def calculate_total_pattern(self, theta):
         if not self.arrays:
             return np.zeros_like(theta)
-            
-        total_pattern = np.zeros_like(theta, dtype=complex)
+
+        same_shape = len({a.num_elements for a in self.arrays}) == 1
+        if _array_factor is None and same_shape and len(self.arrays) > 1:
+            # One einsum covers every array at once instead of K separate
+            # vectorized passes through Python
+            pos_stack, phase_stack, k_per_array = self._stack_arrays()
+            directions = np.stack((np.cos(theta), np.sin(theta)))  # (2, M)
+            proj = np.einsum('knd,dm->knm', pos_stack, directions)
+            af = np.exp(1j * (k_per_array[:, None, None] * proj +
+                              phase_stack[:, :, None])).sum(axis=1)  # (K, M)
+            return np.abs(af).sum(axis=0) / (pos_stack.shape[1] * len(self.arrays))
+
+        total_pattern = np.zeros_like(theta, dtype=float)
         for array in self.arrays:
             total_pattern += array.calculate_array_factor(theta)
-            
-        return np.abs(total_pattern) / len(self.arrays)
+
+        return total_pattern / len(self.arrays)
     
     def calculate_total_interference_map(self, x_range, y_range):
         """Calculate total interference pattern from all arrays"""
-        if not self.arrays:
-            x = np.linspace(x_range[0], x_range[1], x_range[2])
-            y = np.linspace(y_range[0], y_range[1], y_range[2])
-            X, Y = np.meshgrid(x, y)
-            return X, Y, np.zeros_like(X, dtype=complex)
-            
-        X, Y, total_field = self.arrays[0].calculate_interference_map(x_range, y_range)
-        
-        for array in self.arrays[1:]:
-            _, _, field = array.calculate_interference_map(x_range, y_range)
-            total_field += field
-            
+        x, y, X, Y = self._get_grid(x_range, y_range)
+
+        # Every array accumulates into one shared buffer, so no per-array
+        # field allocation is needed
+        total_field = np.zeros_like(X, dtype=np.complex64)
+
+        if _interference is not None and self.arrays:
+            # Concatenate every array's elements (with a per-element wave
+            # number) into one flat workload, so a single parallel kernel
+            # launch covers all arrays and keeps every core busy
+            px = np.concatenate([a._px for a in self.arrays]).astype(np.float32)
+            py = np.concatenate([a._py for a in self.arrays]).astype(np.float32)
+            phase_shifts = np.concatenate(
+                [a.phase_shifts for a in self.arrays]).astype(np.float32)
+            k_elem = np.concatenate(
+                [np.full(a.num_elements, a.wave_number) for a in self.arrays]
+            ).astype(np.float32)
+            _interference(px, py, phase_shifts, k_elem, x, y, total_field)
+        else:
+            for array in self.arrays:
+                array._interference_on_grid(x, y, X, Y, out=total_field)
+
         return X, Y, total_field
     
     def get_all_steering_info(self):
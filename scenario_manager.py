@@ -1,61 +1,179 @@
 import json
 import os
+import re
+import tempfile
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt5.QtWidgets import (QInputDialog, QMessageBox)
 
+# Characters stripped from user-entered scenario names
+_UNSAFE_CHARS = re.compile(r'[^A-Za-z0-9_ ]')
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+# Shape of a scenario file; compiled once into a specialized validator
+# when fastjsonschema is installed
+_SCENARIO_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'num_elements': {'type': 'integer'},
+        'element_spacing': {'type': 'number'},
+        'frequency': {'type': 'number'},
+        'position': {'type': 'array', 'items': {'type': 'number'},
+                     'minItems': 2, 'maxItems': 2},
+        'curved_array': {'type': 'boolean'},
+        'curvature_radius': {'type': ['number', 'null']},
+    },
+    'required': ['num_elements', 'element_spacing', 'frequency'],
+}
+
+_validate_scenario = (fastjsonschema.compile(_SCENARIO_SCHEMA)
+                      if fastjsonschema is not None else None)
+
+
+# Single encoder instance for the stdlib fallback; json.dumps would
+# construct an equivalent one on every call
+_JSON_ENCODER = json.JSONEncoder(indent=4, separators=(',', ': '))
+
+
+def _dumps(config):
+    """Serialize a scenario config to indented JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return _JSON_ENCODER.encode(config).encode()
+
+
+def _loads(data):
+    """Parse scenario JSON from bytes or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Predefined scenarios, serialized once at import so bootstrap writes
+# raw bytes instead of re-encoding immutable content every startup
+_DEFAULT_SCENARIOS = {
+    "5G_urban_small_cell": {
+        "num_elements": 16,
+        "element_spacing": 0.4,
+        "frequency": 28.0,  # 28 GHz typical for 5G mmWave
+        "position": (0, 0),
+        "curved_array": False
+    },
+    "medical_ultrasound_imaging": {
+        "num_elements": 128,
+        "element_spacing": 0.25,
+        "frequency": 7.5,  # 7.5 MHz typical for medical ultrasound
+        "position": (0, 0),
+        "curved_array": True,
+        "curvature_radius": 15
+    },
+    "tumor_ablation_adaptive": {
+        "num_elements": 64,
+        "element_spacing": 0.5,
+        "frequency": 2.45,  # 2.45 GHz typical for ablation systems
+        "position": (0, 0),
+        "curved_array": True,
+        "curvature_radius": 10
+    }
+}
+
+_DEFAULT_BLOBS = {name: _dumps(config) for name, config in _DEFAULT_SCENARIOS.items()}
+
+
+class _ScenarioIOSignals(QObject):
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+
+class _ScenarioIOTask(QRunnable):
+    """Run one scenario file read or write off the UI thread
+
+    The callable executes in a pool thread; its result (or the error
+    text) is posted back to the UI thread through queued signals.
+    """
+
+    def __init__(self, fn):
+        super().__init__()
+        self.signals = _ScenarioIOSignals()
+        self._fn = fn
+
+    def run(self):
+        try:
+            result = self._fn()
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
+
 class ScenarioManager:
+    # (widget attribute, config key, default, slider units per config unit)
+    # applied in order when a scenario is pushed into the simulator controls;
+    # the scales mirror the slider encodings in the control panel
+    _FIELDS = (
+        ('num_elements_slider', 'num_elements', 8, 1),
+        ('spacing_slider', 'element_spacing', 0.5, 100),
+        ('freq_slider', 'frequency', 1.0, 10),
+    )
+
     def __init__(self, simulator):
         self.simulator = simulator
         self.scenarios_dir = "scenarios"
 
+        # Parsed scenarios keyed by filepath, invalidated via mtime
+        self._scenario_cache = {}
+
+        # In-flight I/O tasks, kept referenced until their signals fire
+        self._io_tasks = []
+
+        # Monotonic counter so stale background loads cannot clobber the
+        # most recently requested scenario
+        self._load_generation = 0
+
         # Ensure scenarios directory exists
         os.makedirs(self.scenarios_dir, exist_ok=True)
 
         # Predefined scenarios
-        self.default_scenarios = {
-            "5G_urban_small_cell": {
-                "num_elements": 16,
-                "element_spacing": 0.4,
-                "frequency": 28.0,  # 28 GHz typical for 5G mmWave
-                "position": (0, 0),
-                "curved_array": False
-            },
-            "medical_ultrasound_imaging": {
-                "num_elements": 128,
-                "element_spacing": 0.25,
-                "frequency": 7.5,  # 7.5 MHz typical for medical ultrasound
-                "position": (0, 0),
-                "curved_array": True,
-                "curvature_radius": 15
-            },
-            "tumor_ablation_adaptive": {
-                "num_elements": 64,
-                "element_spacing": 0.5,
-                "frequency": 2.45,  # 2.45 GHz typical for ablation systems
-                "position": (0, 0),
-                "curved_array": True,
-                "curvature_radius": 10
-            }
-        }
+        self.default_scenarios = _DEFAULT_SCENARIOS
 
-        self.create_scenario_files()
+        self._bootstrap_defaults_if_missing()
 
-    def create_scenario_files(self):
-        """Create JSON files for predefined scenarios"""
-        for name, config in self.default_scenarios.items():
+    def _bootstrap_defaults_if_missing(self):
+        """Create JSON files for predefined scenarios
+
+        Files that already exist with up-to-date content are left alone so
+        startup does not rewrite every default on each launch.
+        """
+        for name, serialized in _DEFAULT_BLOBS.items():
             filepath = os.path.join(self.scenarios_dir, f"{name}.json")
-            with open(filepath, 'w') as f:
-                json.dump(config, f, indent=4)
+            if os.path.exists(filepath):
+                try:
+                    with open(filepath, 'rb') as f:
+                        if f.read() == serialized:
+                            continue
+                except OSError:
+                    pass  # unreadable: rewrite it below
+            with open(filepath, 'wb') as f:
+                f.write(serialized)
 
     def save_current_scenario(self):
         """Save current system configuration as a new scenario"""
         # Collect current parameters
         scenario_config = {
-            "num_elements": self.simulator.num_elements_spin.value(),
-            "element_spacing": self.simulator.spacing_spin.value(),
-            "frequency": self.simulator.freq_spin.value(),
+            "num_elements": self.simulator.num_elements_slider.value(),
+            "element_spacing": self.simulator.spacing_slider.value() / 100.0,
+            "frequency": self.simulator.freq_slider.value() / 10.0,
             "position": (
-                self.simulator.pos_x_spin.value(),
-                self.simulator.pos_y_spin.value()
+                self.simulator.pos_x_slider.value() / 10.0,
+                self.simulator.pos_y_slider.value() / 10.0
             ),
             "curved_array": self.simulator.curved_check.isChecked(),
             "curvature_radius": (self.simulator.radius_spin.value()
@@ -72,78 +190,195 @@ class ScenarioManager:
 
         if ok and name:
             # Sanitize filename
-            safe_name = "".join(x for x in name if x.isalnum() or x in "_ ").rstrip()
+            safe_name = _UNSAFE_CHARS.sub('', name).rstrip()
 
             # Create filepath
             filepath = os.path.join(self.scenarios_dir, f"{safe_name}.json")
 
-            try:
-                # Save scenario
-                with open(filepath, 'w') as f:
-                    json.dump(scenario_config, f, indent=4)
+            # Serialize on the UI thread (cheap), write on a pool thread so
+            # slow disks cannot freeze the interface
+            serialized = _dumps(scenario_config)
 
-                # Update scenario list in combo box
-                self.simulator.scenario_combo.addItem(safe_name)
+            def write_file():
+                # Write to a sibling temp file and rename into place, so a
+                # crash mid-write can never leave a truncated scenario
+                tf = tempfile.NamedTemporaryFile('wb', dir=self.scenarios_dir,
+                                                 prefix='.tmp-', suffix='.json',
+                                                 delete=False)
+                try:
+                    with tf:
+                        tf.write(serialized)
+                    os.replace(tf.name, filepath)
+                except BaseException:
+                    # Don't orphan the temp file on a failed write/rename
+                    try:
+                        os.unlink(tf.name)
+                    except OSError:
+                        pass
+                    raise
 
-                QMessageBox.information(
-                    self.simulator,
-                    "Scenario Saved",
-                    f"Scenario '{safe_name}' saved successfully!"
-                )
-
-            except Exception as e:
-                QMessageBox.warning(
+            self._submit_io(
+                write_file,
+                on_finished=lambda _: self._on_scenario_saved(filepath, safe_name),
+                on_error=lambda message: QMessageBox.warning(
                     self.simulator,
                     "Save Error",
-                    f"Could not save scenario: {str(e)}"
-                )
+                    f"Could not save scenario: {message}"
+                ))
+
+    def _on_scenario_saved(self, filepath, safe_name):
+        """Finish a background save on the UI thread"""
+        # Drop any stale cached parse for this path
+        self._scenario_cache.pop(filepath, None)
+
+        # Update scenario list in combo box
+        self.simulator.scenario_combo.addItem(safe_name)
+
+        QMessageBox.information(
+            self.simulator,
+            "Scenario Saved",
+            f"Scenario '{safe_name}' saved successfully!"
+        )
+
+    def _submit_io(self, fn, on_finished, on_error):
+        """Run fn on the global thread pool, posting results back via signals"""
+        task = _ScenarioIOTask(fn)
+        self._io_tasks.append(task)
+
+        def finish(result):
+            self._io_tasks.remove(task)
+            on_finished(result)
+
+        def fail(message):
+            self._io_tasks.remove(task)
+            on_error(message)
+
+        task.signals.finished.connect(finish)
+        task.signals.error.connect(fail)
+        QThreadPool.globalInstance().start(task)
 
     def load_scenario(self, scenario_name: str):
         """Load a scenario from file and configure simulator with correct array indexing"""
         filepath = os.path.join(self.scenarios_dir, f"{scenario_name}.json")
 
         try:
-            with open(filepath, 'r') as f:
-                scenario_config = json.load(f)
+            mtime = os.stat(filepath).st_mtime
+        except FileNotFoundError:
+            print(f"Scenario {scenario_name} not found.")
+            return
 
-            # Clear existing arrays
-            while self.simulator.system.arrays:
-                self.simulator.system.remove_array(0)
+        # Every request bumps the generation; completions tagged with an
+        # older one are dropped so the last selection always wins
+        self._load_generation += 1
+        generation = self._load_generation
 
-            # Reset array list widget
-            self.simulator.array_list.clear()
+        # Reselecting an unchanged scenario hits the parse cache instead of
+        # rereading the file; a miss reads and parses on a pool thread and
+        # applies the config back on the UI thread
+        cached = self._scenario_cache.get(filepath)
+        if cached is not None and cached[0] == mtime:
+            self._apply_scenario(cached[1])
+            return
 
-            # Configure UI elements
-            self.simulator.num_elements_spin.setValue(scenario_config.get('num_elements', 8))
-            self.simulator.spacing_spin.setValue(scenario_config.get('element_spacing', 0.5))
-            self.simulator.freq_spin.setValue(scenario_config.get('frequency', 1.0))
-            self.simulator.pos_x_spin.setValue(scenario_config.get('position', (0, 0))[0])
-            self.simulator.pos_y_spin.setValue(scenario_config.get('position', (0, 0))[1])
+        def read_file():
+            # Slurp the whole file in one buffered read and hand the
+            # parser a single contiguous buffer
+            with open(filepath, 'rb', buffering=65536) as f:
+                return _loads(f.read())
 
-            # Curved array configuration
-            self.simulator.curved_check.setChecked(scenario_config.get('curved_array', False))
-            if scenario_config.get('curved_array', False):
-                self.simulator.radius_spin.setValue(scenario_config.get('curvature_radius', 10))
-                self.simulator.radius_spin.setEnabled(True)
+        self._submit_io(
+            read_file,
+            on_finished=lambda config: self._on_scenario_loaded(
+                filepath, mtime, config, generation),
+            on_error=lambda message: print(
+                f"Error loading scenario {scenario_name}: {message}"))
+
+    def _on_scenario_loaded(self, filepath, mtime, scenario_config, generation):
+        """Cache and apply a scenario parsed on a pool thread"""
+        # Reject malformed files up front rather than leaving the widgets
+        # in a partially applied state
+        if _validate_scenario is not None:
+            try:
+                _validate_scenario(scenario_config)
+            except fastjsonschema.JsonSchemaException as e:
+                print(f"Invalid scenario {filepath}: {e}")
+                return
+        self._scenario_cache[filepath] = (mtime, scenario_config)
+        if generation != self._load_generation:
+            # A newer load was requested while this one was in flight;
+            # keep the parse cached but leave the widgets to the latest
+            return
+        self._apply_scenario(scenario_config)
+
+    def _apply_scenario(self, scenario_config):
+        """Push a parsed scenario config into the simulator widgets"""
+        # Batch the widget mutations: with signals blocked and repaints
+        # suspended, the cascade of setValue/setChecked calls cannot
+        # retrigger plot recomputation; one refresh runs at the end
+        sim = self.simulator
+        widgets = (sim.num_elements_slider, sim.spacing_slider, sim.freq_slider,
+                   sim.pos_x_slider, sim.pos_y_slider, sim.curved_check,
+                   sim.radius_spin, sim.array_list)
+        sim.setUpdatesEnabled(False)
+        for widget in widgets:
+            widget.blockSignals(True)
+        try:
+            # Clear existing arrays in one step rather than popping the
+            # list front repeatedly
+            sim.system.clear_arrays()
+
+            # Configure UI elements from the field table
+            get = scenario_config.get
+            for attr, key, default, scale in self._FIELDS:
+                getattr(sim, attr).setValue(int(round(get(key, default) * scale)))
+            position = get('position', (0, 0))
+            sim.pos_x_slider.setValue(int(round(position[0] * 10)))
+            sim.pos_y_slider.setValue(int(round(position[1] * 10)))
+
+            # Curved array configuration; the checkbox's stateChanged
+            # handler is blocked here, so mirror its enable/disable of the
+            # radius spin explicitly for both states
+            curved = get('curved_array', False)
+            sim.curved_check.setChecked(curved)
+            sim.radius_spin.setEnabled(curved)
+            if curved:
+                sim.radius_spin.setValue(get('curvature_radius', 10))
 
             # Add the configured array
-            self.simulator.add_array()
+            sim.add_array()
 
-            # Update array list to show correct indexing
-            self.simulator.array_list.clear()
-            for i in range(len(self.simulator.system.arrays)):
-                self.simulator.array_list.addItem(f"Array {i + 1}")
+            # Update array list to show correct indexing with one model
+            # insert instead of per-item appends
+            sim.array_list.clear()
+            sim.array_list.addItems(
+                [f"Array {i + 1}" for i in range(len(sim.system.arrays))])
+        finally:
+            for widget in widgets:
+                widget.blockSignals(False)
+            sim.setUpdatesEnabled(True)
 
-            # Update plots
-            self.simulator.update_plots()
+        # The blocked valueChanged signals also carried the label updates;
+        # resync the labels once now that the sliders are settled
+        sim.update_num_elements_label(sim.num_elements_slider.value())
+        sim.update_spacing_label(sim.spacing_slider.value())
+        sim.update_freq_label(sim.freq_slider.value())
+        sim.update_pos_x_label(sim.pos_x_slider.value())
+        sim.update_pos_y_label(sim.pos_y_slider.value())
 
-        except FileNotFoundError:
-            print(f"Scenario {scenario_name} not found.")
-        except json.JSONDecodeError:
-            print(f"Error decoding scenario {scenario_name}.")
+        # Update plots
+        sim.update_plots()
 
     def list_scenarios(self):
-        """List available scenario names"""
-        return list(self.default_scenarios.keys())
+        """List available scenario names
+
+        Only filenames are indexed here; each scenario's JSON is parsed
+        lazily when it is actually loaded.
+        """
+        # Dot-prefixed names are hidden working files (e.g. leftover save
+        # temps), not scenarios
+        with os.scandir(self.scenarios_dir) as entries:
+            return sorted(entry.name[:-5] for entry in entries
+                          if entry.is_file() and entry.name.endswith('.json')
+                          and not entry.name.startswith('.'))
 
 